@@ -6,28 +6,76 @@ Controls: Arrow keys or WASD to move, 'q' to quit.
 """
 
 import curses
+import os
+import queue
 import random
+import select
+import sys
+import threading
 import time
-from enum import Enum
-from collections import deque
 
-class Direction(Enum):
-    UP = (-1, 0)
-    DOWN = (1, 0)
-    LEFT = (0, -1)
-    RIGHT = (0, 1)
+# Synchronized output (DEC private mode 2026): the terminal holds the frame
+# until the end marker so it is shown atomically
+SYNC_BEGIN = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+
+# Smallest terminal the game can be played in
+MIN_HEIGHT = 10
+MIN_WIDTH = 40
+
+# Minimum time between frames (60 fps cap)
+FRAME_INTERVAL = 1 / 60
+
+# Longest wait for a key before the game loop carries on (seconds)
+POLL_INTERVAL = 0.01
+
+# Directions as (dy, dx) steps
+UP = (-1, 0)
+DOWN = (1, 0)
+LEFT = (0, -1)
+RIGHT = (0, 1)
+
+# Reverse of each direction; the snake may not turn back into itself
+OPPOSITE_DIRECTIONS = {
+    UP: DOWN,
+    DOWN: UP,
+    LEFT: RIGHT,
+    RIGHT: LEFT
+}
+
+# Keys mapped to the direction they steer (arrow keys and WASD)
+DIRECTION_KEYS = {
+    curses.KEY_UP: UP, ord('w'): UP, ord('W'): UP,
+    curses.KEY_DOWN: DOWN, ord('s'): DOWN, ord('S'): DOWN,
+    curses.KEY_LEFT: LEFT, ord('a'): LEFT, ord('A'): LEFT,
+    curses.KEY_RIGHT: RIGHT, ord('d'): RIGHT, ord('D'): RIGHT
+}
+
+# Message shown below the board when the round ends
+GAME_OVER_TEXT = "GAME OVER! Press 'r' to restart or 'q' to quit"
+
+# Keys that quit or restart the game
+QUIT_KEYS = frozenset({ord('q'), ord('Q')})
+RESTART_KEYS = frozenset({ord('r'), ord('R')})
 
 class SnakeGame:
     def __init__(self, stdscr):
         self.stdscr = stdscr
+        
+        # Frames are drawn on a render thread. ncurses is not thread-safe, so
+        # every curses call and every change to drawn state holds the lock.
+        # The queue holds at most one pending frame request.
+        self._curses_lock = threading.Lock()
+        self._render_q = queue.Queue(maxsize=1)
+        self._render_error = None  # Raised again on the main thread
+        
         self.setup_screen()
         self.reset_game()
     
     def setup_screen(self):
         """Initialize the game screen and colors."""
         curses.curs_set(0)  # Hide cursor
-        self.stdscr.nodelay(1)  # Non-blocking input
-        self.stdscr.timeout(100)  # Game speed (milliseconds)
+        self.stdscr.nodelay(1)  # Non-blocking input; waiting is done in select
         
         # Initialize colors
         curses.start_color()
@@ -36,8 +84,18 @@ class SnakeGame:
         curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK) # Score
         curses.init_pair(4, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Border
         
+        # Cache color attributes used while drawing
+        self._c_snake = curses.color_pair(1)
+        self._c_snake_bold = self._c_snake | curses.A_BOLD
+        self._c_food_bold = curses.color_pair(2) | curses.A_BOLD
+        self._c_game_over = self._c_food_bold | curses.A_BLINK
+        self._c_score = curses.color_pair(3)
+        self._c_title = self._c_score | curses.A_BOLD
+        self._c_border = curses.color_pair(4)
+        
         # Get screen dimensions
         self.height, self.width = self.stdscr.getmaxyx()
+        self.too_small = False
         
         # Create game area (leave space for borders and score)
         self.game_height = self.height - 4
@@ -46,17 +104,25 @@ class SnakeGame:
         # Create game window
         self.game_win = curses.newwin(self.game_height, self.game_width, 2, 1)
         
+        # Wrap frames in synchronized output unless the terminal is dumb
+        self.sync_output = os.environ.get("TERM", "dumb") not in ("", "dumb")
+        
+        # Static chrome is drawn once; draw() only refreshes stdscr after
+        # something on it changed
+        self._score_width = 0
+        self.stdscr.clear()
+        self.draw_chrome()
+        
     def reset_game(self):
         """Reset the game state."""
         # Snake starts in the middle of the screen
         start_y = self.game_height // 2
-        start_x = self.game_width // 2
-        
-        # Snake body (head at the front)
-        self.snake = deque([(start_y, start_x), (start_y, start_x - 1), (start_y, start_x - 2)])
+        start = start_y * self.game_width + self.game_width // 2
+        self.build_board([start - 2, start - 1, start])
         
-        # Initial direction
-        self.direction = Direction.RIGHT
+        # Initial direction, and the direction of the last move made
+        self.dy, self.dx = RIGHT
+        self.last_dy, self.last_dx = RIGHT
         
         # Score
         self.score = 0
@@ -64,65 +130,154 @@ class SnakeGame:
         # Food position
         self.spawn_food()
         
+        # Game speed: seconds between snake moves, and when the next is due
+        self.tick_interval = 0.1
+        self.next_tick = time.monotonic() + self.tick_interval
+        
         # Game state
         self.game_over = False
         
+        # Rendering state: cells changed since the last frame, whether
+        # anything needs drawing, and whether the board needs a full repaint
+        self.dirty = []
+        self.dirty_frame = True
+        self._board_drawn = False
+        self._drawn_score = None
+        
+    def build_board(self, cells):
+        """Lay out the snake, given tail to head, on a board of the current size.
+        
+        Cells are packed as y * game_width + x.
+        """
+        # Snake body as a ring buffer ordered tail to head; it can never hold
+        # more cells than the board has
+        self._board_size = self.game_height * self.game_width
+        self._ring = cells + [None] * (self._board_size - len(cells))
+        self._tail = 0
+        self._head = len(cells) - 1
+        
+        # Occupancy bitmap indexed by cell; 1 where the snake is
+        self._occ = bytearray(self._board_size)
+        for cell in cells:
+            self._occ[cell] = 1
+        
+        # Cells not covered by the snake, kept in lockstep with the bitmap
+        self.free_cells = set(range(self._board_size)) - set(cells)
+    
     def spawn_food(self):
         """Spawn food at a random location not occupied by the snake."""
-        while True:
-            food_y = random.randint(0, self.game_height - 1)
-            food_x = random.randint(0, self.game_width - 1)
-            
-            if (food_y, food_x) not in self.snake:
-                self.food = (food_y, food_x)
-                break
+        # Rejection sampling is cheap while most of the board is free
+        if len(self.free_cells) > 0.2 * self._board_size:
+            randrange = random.randrange
+            for _ in range(8):
+                # Cells are packed, so one draw picks both coordinates
+                food = randrange(self._board_size)
+                if not self._occ[food]:
+                    self.food = food
+                    return
+        
+        # Otherwise pick directly from the free cells
+        if self.free_cells:
+            self.food = random.choice(tuple(self.free_cells))
+        else:
+            self.food = None
+    
+    def snake_cells(self):
+        """Return the snake's packed cells as a list ordered from tail to head."""
+        if self._tail <= self._head:
+            return self._ring[self._tail:self._head + 1]
+        return self._ring[self._tail:] + self._ring[:self._head + 1]
     
     def handle_input(self):
         """Handle user input for controlling the snake."""
-        key = self.stdscr.getch()
-        
-        # Quit game
-        if key == ord('q') or key == ord('Q'):
-            return False
-        
-        # Direction controls
-        new_direction = None
-        
-        if key == curses.KEY_UP or key == ord('w') or key == ord('W'):
-            new_direction = Direction.UP
-        elif key == curses.KEY_DOWN or key == ord('s') or key == ord('S'):
-            new_direction = Direction.DOWN
-        elif key == curses.KEY_LEFT or key == ord('a') or key == ord('A'):
-            new_direction = Direction.LEFT
-        elif key == curses.KEY_RIGHT or key == ord('d') or key == ord('D'):
-            new_direction = Direction.RIGHT
-        
-        # Prevent the snake from moving into itself
-        if new_direction:
-            opposite_directions = {
-                Direction.UP: Direction.DOWN,
-                Direction.DOWN: Direction.UP,
-                Direction.LEFT: Direction.RIGHT,
-                Direction.RIGHT: Direction.LEFT
-            }
+        # Wait up to one polling interval for a key without holding the lock,
+        # so the render thread can draw meanwhile
+        select.select([sys.stdin], [], [], POLL_INTERVAL)
+        
+        # Drain every pending key. Of the direction keys, only the latest
+        # usable one is applied.
+        blocked = OPPOSITE_DIRECTIONS[(self.last_dy, self.last_dx)]
+        latest = None
+        
+        with self._curses_lock:
+            while True:
+                key = self.stdscr.getch()
+                if key == -1:
+                    break
+                
+                # Quit game
+                if key in QUIT_KEYS:
+                    return False
+                
+                if key == curses.KEY_RESIZE:
+                    self.handle_resize()
+                    continue
+                
+                # Direction controls; the snake may not reverse into itself,
+                # so a key opposite to the last move made is ignored
+                new_direction = DIRECTION_KEYS.get(key)
+                if new_direction and new_direction != blocked:
+                    latest = new_direction
             
-            if new_direction != opposite_directions.get(self.direction):
-                self.direction = new_direction
+            if latest and latest != (self.dy, self.dx):
+                self.dy, self.dx = latest
+                self.dirty_frame = True
         
         return True
     
+    def handle_resize(self):
+        """Lay the screen out again after the terminal was resized."""
+        curses.update_lines_cols()
+        self.height, self.width = self.stdscr.getmaxyx()
+        
+        # Pause while the terminal is too small to draw in
+        self.too_small = self.height < MIN_HEIGHT or self.width < MIN_WIDTH
+        if self.too_small:
+            return
+        
+        # Unpack the snake and food against the old board width
+        cells = [divmod(cell, self.game_width) for cell in self.snake_cells()]
+        food = divmod(self.food, self.game_width) if self.food is not None else None
+        
+        # Resize the game area and repaint the chrome
+        self.game_height = self.height - 4
+        self.game_width = self.width - 2
+        self.game_win.resize(self.game_height, self.game_width)
+        self.game_win.mvwin(2, 1)
+        self.stdscr.clear()
+        self.draw_chrome()
+        
+        # Keep playing if the snake still fits, otherwise start over
+        if any(y >= self.game_height or x >= self.game_width for y, x in cells):
+            self.reset_game()
+            return
+        self.build_board([y * self.game_width + x for y, x in cells])
+        self.food = None
+        if food is not None:
+            food_y, food_x = food
+            if food_y < self.game_height and food_x < self.game_width:
+                self.food = food_y * self.game_width + food_x
+        if self.food is None:
+            self.spawn_food()
+        
+        self._board_drawn = False
+        self.dirty_frame = True
+    
     def update_snake(self):
         """Update snake position and check for collisions."""
         if self.game_over:
             return
         
+        # Every tick either moves the snake or ends the game
+        self.dirty_frame = True
+        
         # Get current head position
-        head_y, head_x = self.snake[0]
+        head = self._ring[self._head]
         
         # Calculate new head position
-        dy, dx = self.direction.value
-        new_head_y = head_y + dy
-        new_head_x = head_x + dx
+        self.last_dy, self.last_dx = self.dy, self.dx
+        new_head_y = head // self.game_width + self.dy
+        new_head_x = head % self.game_width + self.dx
         
         # Check wall collision
         if (new_head_y < 0 or new_head_y >= self.game_height or
@@ -131,101 +286,274 @@ class SnakeGame:
             return
         
         # Check self collision
-        if (new_head_y, new_head_x) in self.snake:
+        new_head = new_head_y * self.game_width + new_head_x
+        if self._occ[new_head]:
             self.game_over = True
             return
         
         # Add new head
-        self.snake.appendleft((new_head_y, new_head_x))
+        self.dirty.append(('body', head))
+        self.dirty.append(('add', new_head))
+        self._head = (self._head + 1) % self._board_size
+        self._ring[self._head] = new_head
+        self._occ[new_head] = 1
+        self.free_cells.discard(new_head)
         
         # Check if food is eaten
-        if (new_head_y, new_head_x) == self.food:
+        if new_head == self.food:
             self.score += 10
             self.spawn_food()
+            if self.food is not None:
+                self.dirty.append(('food', self.food))
             # Increase game speed slightly
-            self.stdscr.timeout(max(50, 100 - self.score // 50))
+            self.tick_interval = max(0.05, 0.1 - self.score / 50000)
         else:
             # Remove tail if no food eaten
-            self.snake.pop()
+            tail = self._ring[self._tail]
+            self._tail = (self._tail + 1) % self._board_size
+            self._occ[tail] = 0
+            self.free_cells.add(tail)
+            self.dirty.append(('del', tail))
     
-    def draw(self):
-        """Draw the game state on the screen."""
-        # Clear screen
-        self.stdscr.clear()
-        self.game_win.clear()
-        
+    def draw_chrome(self):
+        """Draw the border, title and controls, which never change during play."""
         # Draw border
-        self.stdscr.attron(curses.color_pair(4))
+        self.stdscr.attron(self._c_border)
         self.stdscr.border()
-        self.stdscr.attroff(curses.color_pair(4))
+        self.stdscr.attroff(self._c_border)
         
         # Draw title
         title = "SNAKE GAME"
-        self.stdscr.addstr(0, (self.width - len(title)) // 2, title, curses.color_pair(3) | curses.A_BOLD)
-        
-        # Draw score
-        score_text = f"Score: {self.score}"
-        self.stdscr.addstr(1, 2, score_text, curses.color_pair(3))
+        self.stdscr.addstr(0, (self.width - len(title)) // 2, title, self._c_title)
         
         # Draw controls
         controls = "Controls: Arrow keys/WASD to move, 'q' to quit"
         if len(controls) < self.width - 4:
-            self.stdscr.addstr(1, self.width - len(controls) - 2, controls, curses.color_pair(4))
+            self.stdscr.addstr(1, self.width - len(controls) - 2, controls, self._c_border)
         
-        # Draw snake
-        for i, (y, x) in enumerate(self.snake):
-            if i == 0:  # Head
-                self.game_win.addch(y, x, '@', curses.color_pair(1) | curses.A_BOLD)
-            else:  # Body
-                self.game_win.addch(y, x, '#', curses.color_pair(1))
+        # Fit the game over message inside the border and center it
+        self._game_over_text = GAME_OVER_TEXT[:self.width - 2]
+        self._game_over_x = max(1, (self.width - len(self._game_over_text)) // 2)
         
-        # Draw food
-        food_y, food_x = self.food
-        self.game_win.addch(food_y, food_x, '*', curses.color_pair(2) | curses.A_BOLD)
+        self._stdscr_changed = True
+    
+    def draw(self):
+        """Draw the game state on the screen."""
+        if self.sync_output:
+            sys.stdout.write(SYNC_BEGIN)
+            sys.stdout.flush()
+        
+        if not self._board_drawn:
+            self.draw_full()
+        else:
+            self.draw_dirty()
         
         # Draw game over message
         if self.game_over:
-            game_over_text = "GAME OVER! Press 'r' to restart or 'q' to quit"
-            game_over_y = self.height - 2
-            game_over_x = (self.width - len(game_over_text)) // 2
-            self.stdscr.addstr(game_over_y, game_over_x, game_over_text, 
-                              curses.color_pair(2) | curses.A_BOLD | curses.A_BLINK)
-        
-        # Refresh windows
-        self.stdscr.refresh()
+            self.stdscr.addstr(self.height - 2, self._game_over_x, self._game_over_text,
+                               self._c_game_over)
+            self._stdscr_changed = True
+        
+        # Refresh windows; the chrome on stdscr rarely changes
+        if self._stdscr_changed:
+            self.stdscr.refresh()
+            self._stdscr_changed = False
         self.game_win.refresh()
+        
+        if self.sync_output:
+            sys.stdout.write(SYNC_END)
+            sys.stdout.flush()
+        
+        self.dirty_frame = False
+    
+    def draw_full(self):
+        """Paint the score, snake and food from scratch."""
+        self.game_win.erase()
+        
+        # Remove any game over message left from the previous round
+        self.stdscr.addstr(self.height - 2, 1, ' ' * (self.width - 2))
+        
+        self.draw_score()
+        
+        # Draw snake body, one addstr per horizontal run of cells
+        rows = {}
+        for cell in self.snake_cells()[:-1]:
+            y, x = divmod(cell, self.game_width)
+            rows.setdefault(y, []).append(x)
+        for y, xs in rows.items():
+            xs.sort()
+            start = prev = xs[0]
+            for x in xs[1:]:
+                if x != prev + 1:
+                    self.draw_cells(y, start, '#' * (prev - start + 1), self._c_snake)
+                    start = x
+                prev = x
+            self.draw_cells(y, start, '#' * (prev - start + 1), self._c_snake)
+        
+        # Draw snake head
+        head_y, head_x = divmod(self._ring[self._head], self.game_width)
+        self.draw_cells(head_y, head_x, '@', self._c_snake_bold)
+        
+        # Draw food (none left once the snake fills the board)
+        if self.food is not None:
+            food_y, food_x = divmod(self.food, self.game_width)
+            self.draw_cells(food_y, food_x, '*', self._c_food_bold)
+        
+        self._board_drawn = True
+        self.dirty.clear()
+    
+    def draw_dirty(self):
+        """Repaint only the cells that changed since the last frame."""
+        for kind, cell in self.dirty:
+            y, x = divmod(cell, self.game_width)
+            if kind == 'add':  # New head
+                self.draw_cells(y, x, '@', self._c_snake_bold)
+            elif kind == 'body':  # Previous head becomes body
+                self.draw_cells(y, x, '#', self._c_snake)
+            elif kind == 'del':  # Vacated tail
+                self.draw_cells(y, x, ' ')
+            elif kind == 'food':
+                self.draw_cells(y, x, '*', self._c_food_bold)
+        self.dirty.clear()
+        
+        # Draw score only when it changed
+        if self.score != self._drawn_score:
+            self.draw_score()
+    
+    def draw_cells(self, y, x, text, attr=0):
+        """Write text into the game window starting at board cell (y, x)."""
+        try:
+            self.game_win.addstr(y, x, text, attr)
+        except curses.error:
+            # Writing the bottom-right cell moves the cursor past the end of
+            # the window; curses reports that as an error after the write
+            if y != self.game_height - 1 or x + len(text) != self.game_width:
+                raise
+    
+    def draw_score(self):
+        """Draw the score line."""
+        score_text = f"Score: {self.score}"
+        # Pad over a longer score left from before a restart
+        self.stdscr.addstr(1, 2, score_text.ljust(self._score_width), self._c_score)
+        self._score_width = len(score_text)
+        self._drawn_score = self.score
+        self._stdscr_changed = True
+    
+    def request_draw(self):
+        """Ask the render thread for a frame; a pending request already covers it."""
+        try:
+            self._render_q.put_nowait(True)
+        except queue.Full:
+            pass
+    
+    def render_loop(self):
+        """Draw frames on request until told to stop with None.
+        
+        An exception from draw() is kept for the game loop to raise, and
+        later requests are then only acknowledged so nothing waits forever.
+        """
+        while True:
+            frame = self._render_q.get()
+            try:
+                if frame is None:
+                    return
+                with self._curses_lock:
+                    # A resize may have made the screen too small to draw in
+                    # since this frame was requested
+                    if self._render_error is None and not self.too_small:
+                        self.draw()
+            except Exception as error:
+                self._render_error = error
+            finally:
+                self._render_q.task_done()
+    
+    def check_renderer(self):
+        """Raise any exception the render thread hit while drawing."""
+        if self._render_error is not None:
+            raise self._render_error
     
     def handle_game_over(self):
         """Handle game over state."""
+        # The render thread is idle here, so curses is used without the lock
         self.stdscr.nodelay(0)  # Blocking input
         
         while True:
             key = self.stdscr.getch()
             
-            if key == ord('q') or key == ord('Q'):
+            if key in QUIT_KEYS:
                 return False
-            elif key == ord('r') or key == ord('R'):
+            elif key in RESTART_KEYS:
                 self.reset_game()
+            elif key == curses.KEY_RESIZE:
+                self.handle_resize()
+                if not self.too_small and self.game_over:
+                    self.draw()
+            
+            # A restart, or a resize the old snake no longer fits, starts over
+            if not self.game_over:
                 self.stdscr.nodelay(1)  # Non-blocking input
-                self.stdscr.timeout(100)  # Reset game speed
                 return True
     
     def run(self):
         """Main game loop."""
+        renderer = threading.Thread(target=self.render_loop, daemon=True)
+        renderer.start()
+        try:
+            self.game_loop()
+        finally:
+            # Empty the slot so the stop request cannot block; only this
+            # thread puts requests, so it stays free for put_nowait
+            try:
+                self._render_q.get_nowait()
+                self._render_q.task_done()
+            except queue.Empty:
+                pass
+            self._render_q.put_nowait(None)
+            renderer.join()
+    
+    def game_loop(self):
+        """Poll input, advance the snake and request frames until the player quits."""
+        last_draw = 0.0
+        
+        # Bind what the loop calls on every pass to locals
+        clock = time.monotonic
+        handle_input = self.handle_input
+        update_snake = self.update_snake
+        request_draw = self.request_draw
+        lock = self._curses_lock
+        
         while True:
             # Handle input
-            if not self.handle_input():
+            if not handle_input():
                 break
             
-            # Update game state
-            if not self.game_over:
-                self.update_snake()
+            self.check_renderer()
+            
+            if self.too_small:
+                continue
+            
+            # Update game state once per tick, independently of input polling
+            now = clock()
+            if not self.game_over and now >= self.next_tick:
+                with lock:
+                    update_snake()
+                self.next_tick += self.tick_interval
+                if self.next_tick < now:  # Fell behind; don't burst to catch up
+                    self.next_tick = now + self.tick_interval
             
-            # Draw everything
-            self.draw()
+            # Draw only when something changed, at most FRAME_INTERVAL apart
+            if self.dirty_frame and now - last_draw >= FRAME_INTERVAL:
+                request_draw()
+                last_draw = now
             
             # Handle game over
             if self.game_over:
+                # Let the render thread finish, then make sure the final
+                # frame is on screen before blocking
+                self._render_q.join()
+                self.check_renderer()
+                if self.dirty_frame:
+                    self.draw()
                 if not self.handle_game_over():
                     break
 
@@ -236,7 +564,7 @@ def main():
         stdscr = curses.initscr()
         height, width = stdscr.getmaxyx()
         
-        if height < 10 or width < 40:
+        if height < MIN_HEIGHT or width < MIN_WIDTH:
             curses.endwin()
             print("Terminal too small! Please resize to at least 40x10 characters.")
             return